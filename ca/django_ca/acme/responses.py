@@ -22,6 +22,9 @@ from django.urls import reverse
 
 from .messages import Order
 
+#: Prefix for ACME error types, see RFC 8555, section 6.7.
+ERROR_TYPE_PREFIX = 'urn:ietf:params:acme:error:'
+
 
 class AcmeResponse(JsonResponse):
     """Base class for all ACME responses."""
@@ -93,7 +96,7 @@ class AcmeResponseError(AcmeResponse):
 
     def __init__(self, typ=None, message=''):
         super().__init__({
-            'type': 'urn:ietf:params:acme:error:%s' % (typ or self.type),
+            'type': ERROR_TYPE_PREFIX + (typ or self.type),
             'status': self.status_code,
             'detail': message or self.message,
         }, content_type='application/problem+json')
@@ -18,7 +18,7 @@ in a more pythonic manner and provide access functions."""
 
 # pylint: disable=unsubscriptable-object; https://github.com/PyCQA/pylint/issues/3882
 
-import re
+import functools
 from typing import Dict
 from typing import Type
 from typing import Union
@@ -70,6 +70,20 @@ KEY_TO_EXTENSION: Dict[str, Type[Extension]] = {
 OID_TO_EXTENSION: Dict[x509.ObjectIdentifier, Type[Extension]] = {e.oid: e for e in KEY_TO_EXTENSION.values()}
 
 
+@functools.lru_cache(maxsize=256)
+def _name_for_oid(oid: x509.ObjectIdentifier) -> str:
+    """Cached implementation of :py:func:`get_extension_name`, as the name only depends on the OID."""
+
+    ext_cls = OID_TO_EXTENSION.get(oid)
+    if ext_cls is not None:
+        return ext_cls.name
+
+    # pylint: disable=protected-access; there is no other way to get a human-readable name
+    oid_name = cast(str, oid._name)  # type: ignore
+
+    return oid_name[:1].upper() + oid_name[1:]
+
+
 def get_extension_name(ext: Union[x509.Extension, Extension]) -> str:
     """Function to get the name of an extension.
 
@@ -78,15 +92,27 @@ def get_extension_name(ext: Union[x509.Extension, Extension]) -> str:
     'BasicConstraints'
     """
 
-    if ext.oid in OID_TO_EXTENSION:
-        return OID_TO_EXTENSION[ext.oid].name
-
-    # pylint: disable=protected-access; there is no other way to get a human-readable name
-    oid_name = cast(str, ext.oid._name)  # type: ignore
-
-    return re.sub('^([a-z])', lambda x: x.groups()[0].upper(), oid_name)
+    return _name_for_oid(ext.oid)
 
 
 __all__ = [
     'get_extension_name',
-] + [c.__name__ for c in KEY_TO_EXTENSION.values()]
+    'AuthorityInformationAccess',
+    'AuthorityKeyIdentifier',
+    'BasicConstraints',
+    'CRLDistributionPoints',
+    'CertificatePolicies',
+    'ExtendedKeyUsage',
+    'FreshestCRL',
+    'InhibitAnyPolicy',
+    'IssuerAlternativeName',
+    'KeyUsage',
+    'NameConstraints',
+    'OCSPNoCheck',
+    'PolicyConstraints',
+    'PrecertPoison',
+    'PrecertificateSignedCertificateTimestamps',
+    'SubjectAlternativeName',
+    'SubjectKeyIdentifier',
+    'TLSFeature',
+]
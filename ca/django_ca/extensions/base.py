@@ -606,10 +606,17 @@ class CRLDistributionPointsBase(ListExtension):
     def extension_type(self) -> x509.CRLDistributionPoints:
         return x509.CRLDistributionPoints(distribution_points=[dp.for_extension_type for dp in self.value])
 
+    def from_extension(self, value):
+        self.value = [DistributionPoint.from_cryptography(dp) for dp in value.value]
+
     def parse_value(self, value) -> DistributionPoint:
         if isinstance(value, DistributionPoint):
             return value
-        return DistributionPoint(value)
+        if isinstance(value, x509.DistributionPoint):
+            return DistributionPoint.from_cryptography(value)
+        if isinstance(value, dict):
+            return DistributionPoint.from_dict(value)
+        return DistributionPoint(value)  # None gives an empty point, other types raise ValueError
 
     def serialize(self) -> Dict[str, Union[bool, List[DistributionPointType]]]:
         return {
@@ -71,42 +71,86 @@ class DistributionPoint:
         `RFC 5280, section 4.2.1.13 <https://tools.ietf.org/html/rfc5280#section-4.2.1.13>`_
     """
 
-    full_name: Optional[GeneralNameList] = None
-    relative_name: Optional[x509.RelativeDistinguishedName] = None
-    crl_issuer: Optional[GeneralNameList] = None
-    reasons: Optional[FrozenSet[x509.ReasonFlags]] = None
+    __slots__ = ('full_name', 'relative_name', 'crl_issuer', 'reasons')
+
+    full_name: Optional[GeneralNameList]
+    relative_name: Optional[x509.RelativeDistinguishedName]
+    crl_issuer: Optional[GeneralNameList]
+    reasons: Optional[FrozenSet[x509.ReasonFlags]]
 
     def __init__(self, data: Union[x509.DistributionPoint, Dict[str, Any]] = None) -> None:
         if data is None:
             data = {}
 
         if isinstance(data, x509.DistributionPoint):
-            self.full_name = GeneralNameList.get_from_value(data.full_name)
-            self.relative_name = data.relative_name
-            self.crl_issuer = GeneralNameList.get_from_value(data.crl_issuer)
-            self.reasons = data.reasons
+            self._load_cryptography(data)
         elif isinstance(data, dict):
-            self.full_name = GeneralNameList.get_from_value(data.get('full_name'))
-            self.relative_name = data.get('relative_name')
-            self.crl_issuer = GeneralNameList.get_from_value(data.get('crl_issuer'))
-            self.reasons = data.get('reasons')
-
-            if self.full_name is not None and self.relative_name is not None:
-                raise ValueError('full_name and relative_name cannot both have a value')
-
-            if self.relative_name is not None:
-                self.relative_name = x509_relative_name(self.relative_name)
-            if self.reasons is not None:
-                self.reasons = frozenset([x509.ReasonFlags[r] for r in self.reasons])
+            self._load_dict(data)
         else:
             raise ValueError('data must be x509.DistributionPoint or dict')
 
+    @classmethod
+    def from_cryptography(cls, data: x509.DistributionPoint) -> 'DistributionPoint':
+        """Create an instance from a :py:class:`cg:cryptography.x509.DistributionPoint`.
+
+        Unlike the constructor, this method does not need to check the type of `data`.
+        """
+        dpoint = cls.__new__(cls)
+        dpoint._load_cryptography(data)  # pylint: disable=protected-access
+        return dpoint
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DistributionPoint':
+        """Create an instance from a ``dict``.
+
+        Unlike the constructor, this method does not need to check the type of `data`.
+        """
+        dpoint = cls.__new__(cls)
+        dpoint._load_dict(data)  # pylint: disable=protected-access
+        return dpoint
+
+    def _reason_names(self) -> List[str]:
+        """Get a sorted list of reason names.
+
+        ``reasons`` is a public attribute that may be modified later, so the list is not cached. Callers must
+        make sure that ``reasons`` is not ``None``.
+        """
+        return sorted(r.name for r in self.reasons)
+
+    def _load_cryptography(self, data: x509.DistributionPoint) -> None:
+        self.full_name = GeneralNameList.get_from_value(data.full_name)
+        self.relative_name = data.relative_name
+        self.crl_issuer = GeneralNameList.get_from_value(data.crl_issuer)
+        self.reasons = data.reasons
+
+    def _load_dict(self, data: Dict[str, Any]) -> None:
+        self.full_name = GeneralNameList.get_from_value(data.get('full_name'))
+        self.relative_name = data.get('relative_name')
+        self.crl_issuer = GeneralNameList.get_from_value(data.get('crl_issuer'))
+        self.reasons = data.get('reasons')
+
+        if self.full_name is not None and self.relative_name is not None:
+            raise ValueError('full_name and relative_name cannot both have a value')
+
+        if self.relative_name is not None:
+            self.relative_name = x509_relative_name(self.relative_name)
+        if self.reasons is not None:
+            self.reasons = frozenset([x509.ReasonFlags[r] for r in self.reasons])
+
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, DistributionPoint) and self.full_name == other.full_name \
-            and self.relative_name == other.relative_name and self.crl_issuer == other.crl_issuer \
-            and self.reasons == other.reasons
+        if self is other:
+            return True
+        return isinstance(other, DistributionPoint) and (
+            self.full_name, self.relative_name, self.crl_issuer, self.reasons
+        ) == (other.full_name, other.relative_name, other.crl_issuer, other.reasons)
 
-    def __get_values(self) -> List[str]:
+    def __hash__(self) -> int:
+        full_name = tuple(self.full_name) if self.full_name is not None else None
+        crl_issuer = tuple(self.crl_issuer) if self.crl_issuer is not None else None
+        reasons = tuple(self.reasons) if self.reasons else None
+        return hash((full_name, self.relative_name, crl_issuer, reasons))
+
+    def __repr__(self) -> str:
         values: List[str] = []
         if self.full_name is not None:
             values.append('full_name=%r' % list(self.full_name.serialize()))
@@ -115,17 +159,9 @@ class DistributionPoint:
         if self.crl_issuer is not None:
             values.append('crl_issuer=%r' % list(self.crl_issuer.serialize()))
         if self.reasons:
-            values.append('reasons=%s' % sorted([r.name for r in self.reasons]))
-        return values
-
-    def __hash__(self) -> int:
-        full_name = tuple(self.full_name) if self.full_name is not None else None
-        crl_issuer = tuple(self.crl_issuer) if self.crl_issuer is not None else None
-        reasons = tuple(self.reasons) if self.reasons else None
-        return hash((full_name, self.relative_name, crl_issuer, reasons))
+            values.append('reasons=%s' % self._reason_names())
 
-    def __repr__(self) -> str:
-        return '<DistributionPoint: %s>' % ', '.join(self.__get_values())
+        return '<DistributionPoint: %s>' % ', '.join(values)
 
     def __str__(self) -> str:
         return repr(self)
@@ -133,16 +169,14 @@ class DistributionPoint:
     def as_text(self) -> str:
         """Show as text."""
         if self.full_name is not None:
-            names = [textwrap.indent('* %s' % s, '  ') for s in self.full_name.serialize()]
-            text = '* Full Name:\n%s' % '\n'.join(names)
+            text = '* Full Name:\n%s' % '\n'.join('  * %s' % s for s in self.full_name.serialize())
         elif self.relative_name is not None:  # pragma: no branch
             text = '* Relative Name: %s' % format_relative_name(self.relative_name)
 
         if self.crl_issuer is not None:
-            names = [textwrap.indent('* %s' % s, '  ') for s in self.crl_issuer.serialize()]
-            text += '\n* CRL Issuer:\n%s' % '\n'.join(names)
+            text += '\n* CRL Issuer:\n%s' % '\n'.join('  * %s' % s for s in self.crl_issuer.serialize())
         if self.reasons:
-            text += '\n* Reasons: %s' % ', '.join(sorted([r.name for r in self.reasons]))
+            text += '\n* Reasons: %s' % ', '.join(self._reason_names())
         return text
 
     @property
@@ -162,7 +196,7 @@ class DistributionPoint:
         if self.crl_issuer is not None:
             val['crl_issuer'] = list(self.crl_issuer.serialize())
         if self.reasons is not None:
-            val['reasons'] = list(sorted([r.name for r in self.reasons]))
+            val['reasons'] = self._reason_names()
         return val
 
 
@@ -193,6 +227,8 @@ class PolicyInformation:
         <PolicyInformation(oid=2.5, qualifiers=[{'notice_reference': {...}}])>
     """
 
+    __slots__ = ('_policy_identifier', 'policy_qualifiers')
+
     _policy_identifier: Optional[x509.ObjectIdentifier]
     policy_qualifiers: Optional[List[PolicyQualifier]]
 
@@ -200,15 +236,15 @@ class PolicyInformation:
             self, data: Optional[Union[x509.PolicyInformation, ParsablePolicyInformation]] = None
     ) -> None:
         if isinstance(data, x509.PolicyInformation):
-            self.policy_identifier = data.policy_identifier
+            self._policy_identifier = data.policy_identifier
             self.policy_qualifiers = data.policy_qualifiers
         elif isinstance(data, dict):
-            self.policy_identifier = cast(ParsablePolicyIdentifier, data['policy_identifier'])
+            self._set_policy_identifier(cast(ParsablePolicyIdentifier, data['policy_identifier']))
             self.policy_qualifiers = self.parse_policy_qualifiers(
                 cast(Iterable[ParsablePolicyQualifier], data.get('policy_qualifiers'))
             )
         elif data is None:
-            self.policy_identifier = None
+            self._policy_identifier = None
             self.policy_qualifiers = None
         else:
             raise ValueError('PolicyInformation data must be either x509.PolicyInformation or dict')
@@ -226,8 +262,11 @@ class PolicyInformation:
             self.policy_qualifiers = None
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, PolicyInformation) and self.policy_identifier == other.policy_identifier \
-            and self.policy_qualifiers == other.policy_qualifiers
+        if self is other:
+            return True
+        return isinstance(other, PolicyInformation) and (
+            self._policy_identifier, self.policy_qualifiers
+        ) == (other._policy_identifier, other.policy_qualifiers)
 
     def __getitem__(
             self, key: Union[int, slice]
@@ -247,7 +286,7 @@ class PolicyInformation:
         else:
             tup = tuple(self.policy_qualifiers)
 
-        return hash((self.policy_identifier, tup))
+        return hash((self._policy_identifier, tup))
 
     def __len__(self) -> int:
         if self.policy_qualifiers is None:
@@ -255,10 +294,10 @@ class PolicyInformation:
         return len(self.policy_qualifiers)
 
     def __repr__(self) -> str:
-        if self.policy_identifier is None:
+        if self._policy_identifier is None:
             ident = 'None'
         else:
-            ident = self.policy_identifier.dotted_string
+            ident = self._policy_identifier.dotted_string
 
         return '<PolicyInformation(oid=%s, qualifiers=%r)>' % (ident, self.serialize_policy_qualifiers())
 
@@ -273,10 +312,10 @@ class PolicyInformation:
 
     def as_text(self, width: int = 76) -> str:
         """Show as text."""
-        if self.policy_identifier is None:
+        if self._policy_identifier is None:
             text = 'Policy Identifier: %s\n' % None
         else:
-            text = 'Policy Identifier: %s\n' % self.policy_identifier.dotted_string
+            text = 'Policy Identifier: %s\n' % self._policy_identifier.dotted_string
 
         if self.policy_qualifiers:
             text += 'Policy Qualifiers:\n'
@@ -326,7 +365,7 @@ class PolicyInformation:
     @property
     def for_extension_type(self) -> x509.PolicyInformation:
         """Convert instance to a suitable cryptography class."""
-        return x509.PolicyInformation(policy_identifier=self.policy_identifier,
+        return x509.PolicyInformation(policy_identifier=self._policy_identifier,
                                       policy_qualifiers=self.policy_qualifiers)
 
     def insert(self, index: int, value: ParsablePolicyQualifier) -> None:
@@ -337,29 +376,34 @@ class PolicyInformation:
 
     def _parse_policy_qualifier(self, qualifier: ParsablePolicyQualifier) -> PolicyQualifier:
 
-        if isinstance(qualifier, str):
-            return qualifier
-        if isinstance(qualifier, x509.UserNotice):
+        if isinstance(qualifier, (str, x509.UserNotice)):
             return qualifier
         if isinstance(qualifier, dict):
-            explicit_text = qualifier.get('explicit_text')
-
-            notice_reference = qualifier.get('notice_reference')
-            if isinstance(notice_reference, dict):
-                notice_reference = x509.NoticeReference(
-                    organization=force_str(notice_reference.get('organization', '')),
-                    notice_numbers=[int(i) for i in notice_reference.get('notice_numbers', [])]
-                )
-            elif notice_reference is None:
-                pass  # extra branch to ensure test coverage
-            elif isinstance(notice_reference, x509.NoticeReference):
-                pass  # extra branch to ensure test coverage
-            else:
-                raise ValueError('NoticeReference must be either None, a dict or an x509.NoticeReference')
-
-            return x509.UserNotice(explicit_text=explicit_text, notice_reference=notice_reference)
+            return self._parse_dict_policy_qualifier(qualifier)
         raise ValueError('PolicyQualifier must be string, dict or x509.UserNotice')
 
+    def _parse_dict_policy_qualifier(self, qualifier: Dict[str, Any]) -> x509.UserNotice:
+        explicit_text = qualifier.get('explicit_text')
+
+        notice_reference = qualifier.get('notice_reference')
+        if isinstance(notice_reference, dict):
+            organization = notice_reference.get('organization', '')
+            if not isinstance(organization, str):
+                organization = force_str(organization)
+
+            notice_reference = x509.NoticeReference(
+                organization=organization,
+                notice_numbers=list(map(int, notice_reference.get('notice_numbers', ())))
+            )
+        elif notice_reference is None:
+            pass  # extra branch to ensure test coverage
+        elif isinstance(notice_reference, x509.NoticeReference):
+            pass  # extra branch to ensure test coverage
+        else:
+            raise ValueError('NoticeReference must be either None, a dict or an x509.NoticeReference')
+
+        return x509.UserNotice(explicit_text=explicit_text, notice_reference=notice_reference)
+
     def parse_policy_qualifiers(
             self, qualifiers: Optional[Iterable[ParsablePolicyQualifier]]
     ) -> Optional[List[PolicyQualifier]]:
@@ -422,13 +466,15 @@ class PolicyInformation:
             return qualifier
 
         value = {}
-        if qualifier.explicit_text:
-            value['explicit_text'] = qualifier.explicit_text
+        explicit_text = qualifier.explicit_text
+        if explicit_text:
+            value['explicit_text'] = explicit_text
 
-        if qualifier.notice_reference:
+        notice_reference = qualifier.notice_reference
+        if notice_reference:
             value['notice_reference'] = {
-                'notice_numbers': qualifier.notice_reference.notice_numbers,
-                'organization': qualifier.notice_reference.organization,
+                'notice_numbers': notice_reference.notice_numbers,
+                'organization': notice_reference.organization,
             }
         return value
 
@@ -442,7 +488,7 @@ class PolicyInformation:
     def serialize(self) -> Dict[str, Union[str, SerializedPolicyQualifiers]]:
         """Serialize this policy information."""
         value = {
-            'policy_identifier': self.policy_identifier.dotted_string,
+            'policy_identifier': self._policy_identifier.dotted_string,
         }
         qualifiers = self.serialize_policy_qualifiers()
         if qualifiers:
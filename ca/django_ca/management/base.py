@@ -40,6 +40,9 @@ from ..utils import SUBJECT_FIELDS
 from ..utils import add_colons
 from . import actions
 
+_SUBJECT_KEYS = [f'"{f}"' for f in SUBJECT_FIELDS]
+_VALID_SUBJECT_KEYS = f'{", ".join(_SUBJECT_KEYS[:-1])} and {_SUBJECT_KEYS[-1]}'
+
 
 class BinaryOutputWrapper(OutputWrapper):
     """An output wrapper that allows you to write binary data."""
@@ -49,11 +52,13 @@ class BinaryOutputWrapper(OutputWrapper):
 
     def write(self, msg=b'', style_func=None, ending=None):
         ending = self.ending if ending is None else ending
-        msg = force_bytes(msg)
+        if not isinstance(msg, bytes):
+            msg = force_bytes(msg)
 
-        if ending and not msg.endswith(ending):
-            msg += ending
+        # NOTE: write the ending separately so that large messages (e.g. CRLs) are not copied
         self._out.write(msg)
+        if ending and not msg.endswith(ending):
+            self._out.write(ending)
 
 
 class BaseCommand(_BaseCommand):  # pylint: disable=abstract-method; is a base class
@@ -93,8 +98,8 @@ class BaseCommand(_BaseCommand):  # pylint: disable=abstract-method; is a base c
     def add_algorithm(self, parser):
         """Add the --algorithm option."""
 
-        help_text = 'The HashAlgorithm that will be used to generate the signature (default: %s).' % (
-            ca_settings.CA_DIGEST_ALGORITHM.name)
+        help_text = ('The HashAlgorithm that will be used to generate the signature '
+                     f'(default: {ca_settings.CA_DIGEST_ALGORITHM.name}).')
 
         parser.add_argument(
             '--algorithm', metavar='{sha512,sha256,...}', default=ca_settings.CA_DIGEST_ALGORITHM,
@@ -103,8 +108,7 @@ class BaseCommand(_BaseCommand):  # pylint: disable=abstract-method; is a base c
     @property
     def valid_subject_keys(self):
         """Return human-readable enumeration of valid subject keys (CN/...)."""
-        fields = ['"%s"' % f for f in SUBJECT_FIELDS]
-        return '%s and %s' % (', '.join(fields[:-1]), fields[-1])
+        return _VALID_SUBJECT_KEYS
 
     def add_subject(self, parser, arg='subject', metavar=None, help_text=None):
         """Add subject option."""
@@ -133,15 +137,14 @@ class BaseCommand(_BaseCommand):  # pylint: disable=abstract-method; is a base c
                 default = None
 
         help_text = help_text % {'default': add_colons(default.serial) if default else None}
-        parser.add_argument('%s' % arg, metavar='SERIAL', help=help_text, default=default,
+        parser.add_argument(arg, metavar='SERIAL', help=help_text, default=default,
                             allow_disabled=allow_disabled, allow_unusable=allow_unusable,
                             action=actions.CertificateAuthorityAction)
 
     def add_ecc_curve(self, parser):
         """Add --ecc-curve option."""
-        curve_help = 'Elliptic Curve used for ECC keys (default: %(default)s).' % {
-            'default': ca_settings.CA_DEFAULT_ECC_CURVE.__class__.__name__,
-        }
+        curve_help = ('Elliptic Curve used for ECC keys '
+                      f'(default: {ca_settings.CA_DEFAULT_ECC_CURVE.__class__.__name__}).')
         parser.add_argument('--ecc-curve', metavar='CURVE', action=actions.KeyCurveAction,
                             default=ca_settings.CA_DEFAULT_ECC_CURVE,
                             help=curve_help)
@@ -177,41 +180,38 @@ class BaseCommand(_BaseCommand):  # pylint: disable=abstract-method; is a base c
 
     def add_profile(self, parser, help_text):
         """Add profile-related options."""
+        if not ca_settings.CA_PROFILES:  # pragma: no cover - there are always profiles in the test suite
+            return
+
         group = parser.add_argument_group('profiles', help_text)
         group = group.add_mutually_exclusive_group()
         for name, profile in ca_settings.CA_PROFILES.items():
-            group.add_argument('--%s' % name, action='store_const', const=name, dest='profile',
+            group.add_argument(f'--{name}', action='store_const', const=name, dest='profile',
                                help=profile.get('description', ''))
 
     def indent(self, text, prefix='    '):
         """Get indented text."""
+        if '\n' not in text:  # shortcut for single-line text, with the same semantics as textwrap.indent()
+            return prefix + text if text.strip() else text
         return indent(text, prefix)
 
     def print_extension(self, ext):
         """Print extension to stdout."""
 
-        if isinstance(ext, Extension):
-            if isinstance(ext, NullExtension):
-                if ext.critical:
-                    # NOTE: Only PrecertPoison is ever marked as critical
-                    self.stdout.write('%s (critical): Yes' % ext.name)
-                else:
-                    self.stdout.write('%s: Yes' % ext.name)
-            else:
-                if ext.critical:
-                    self.stdout.write('%s (critical):' % ext.name)
-                else:
-                    self.stdout.write('%s:' % ext.name)
-
-                self.stdout.write(self.indent(ext.as_text()))
+        if isinstance(ext, NullExtension):
+            # NOTE: Only PrecertPoison is ever marked as critical
+            critical = ' (critical)' if ext.critical else ''
+            self.stdout.write(f'{ext.name}{critical}: Yes')
+        elif isinstance(ext, Extension):
+            critical = ' (critical)' if ext.critical else ''
+            self.stdout.write(f'{ext.name}{critical}:\n{self.indent(ext.as_text())}')
         elif isinstance(ext, x509.Extension):
             oid_name = ext.oid._name  # pylint: disable=protected-access; only wai to get name
-            if ext.critical:  # pragma: no cover - all unrecognized extensions that we have are non-critical
-                self.stdout.write('%s (critical): %s' % (oid_name, ext.oid.dotted_string))
-            else:
-                self.stdout.write('%s: %s' % (oid_name, ext.oid.dotted_string))
+            # NOTE: all unrecognized extensions that we have are non-critical
+            critical = ' (critical)' if ext.critical else ''
+            self.stdout.write(f'{oid_name}{critical}: {ext.oid.dotted_string}')
         else:  # pragma: no cover
-            raise ValueError('Received unknown extension type: %s' % type(ext))
+            raise ValueError(f'Received unknown extension type: {type(ext)}')
 
     def print_extensions(self, cert):
         """Print all extensions for the given certificate."""
@@ -230,12 +230,12 @@ class BaseSignCommand(BaseCommand):  # pylint: disable=abstract-method; is a bas
     """Base class for commands signing certificates (sign_cert, resign_cert)."""
 
     add_extensions_help = None  # concrete classes should set this
-    sign_extensions = {
+    sign_extensions = (
         SubjectAlternativeName,
         KeyUsage,
         ExtendedKeyUsage,
         TLSFeature,
-    }
+    )
     subject_help = None  # concrete classes should set this
 
     def add_base_args(self, parser, no_default_ca=False):
@@ -267,8 +267,8 @@ class BaseSignCommand(BaseCommand):  # pylint: disable=abstract-method; is a bas
         # NOTE: Don't set the default value here because it would mask the user not setting anything at all.
         self.add_subject(
             group, arg='--subject', metavar='/key1=value1/key2=value2/...',
-            help_text='''Valid keys are %s. Pass an empty value (e.g. "/C=/ST=...") to remove a field
-                      from the subject.''' % self.valid_subject_keys)
+            help_text=f'''Valid keys are {self.valid_subject_keys}. Pass an empty value (e.g. "/C=/ST=...") to
+                      remove a field from the subject.''')
 
     def add_extensions(self, parser):
         """Add arguments for x509 extensions."""
@@ -288,10 +288,10 @@ class BaseSignCommand(BaseCommand):  # pylint: disable=abstract-method; is a bas
         """Additional tests for validity of some options."""
 
         ca = options['ca']
-        if ca.expires < timezone.now() + options['expires']:
-            max_days = (ca.expires - timezone.now()).days
+        remaining = ca.expires - timezone.now()
+        if remaining < options['expires']:
             raise CommandError(
-                'Certificate would outlive CA, maximum expiry for this CA is %s days.' % max_days)
+                f'Certificate would outlive CA, maximum expiry for this CA is {remaining.days} days.')
 
         # See if we can work with the private key
         self.test_private_key(ca, options['password'])
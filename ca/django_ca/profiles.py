@@ -285,7 +285,7 @@ class Profile:
 
         if add_crl_url is not False and ca.crl_url:
             extensions.setdefault(CRLDistributionPoints.key, CRLDistributionPoints())
-            extensions[CRLDistributionPoints.key].value.append(DistributionPoint({
+            extensions[CRLDistributionPoints.key].value.append(DistributionPoint.from_dict({
                 'full_name': [url.strip() for url in ca.crl_url.split()],
             }))
 
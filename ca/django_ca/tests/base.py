@@ -88,6 +88,11 @@ from ..utils import x509_name
 
 User = get_user_model()
 
+# Use a memory-backed filesystem for temporary CA directories if available (Linux), unless TMPDIR is set
+TMPCADIR_BASE = None
+if not os.environ.get('TMPDIR') and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+    TMPCADIR_BASE = '/dev/shm'
+
 
 def _load_key(data):
     basedir = data.get('basedir', settings.FIXTURES_DIR)
@@ -357,7 +362,7 @@ class override_tmpcadir(override_settings):  # pylint: disable=invalid-name; in
         return super().__call__(test_func)
 
     def enable(self):
-        self.options['CA_DIR'] = tempfile.mkdtemp()
+        self.options['CA_DIR'] = tempfile.mkdtemp(dir=TMPCADIR_BASE)
 
         # copy CAs
         for filename in [v['key_filename'] for v in certs.values() if v['key_filename'] is not False]:
@@ -652,8 +657,10 @@ VQIDAQAB
         """Attach a mock to the given signal."""
         handler = Mock()
         signal.connect(handler)
-        yield handler
-        signal.disconnect(handler)
+        try:
+            yield handler
+        finally:
+            signal.disconnect(handler)
 
     def assertSignature(self, chain, cert):  # pylint: disable=invalid-name
         """Assert that `cert` is properly signed by `chain`.
@@ -950,6 +957,54 @@ class DjangoCAWithGeneratedCAsTestCase(DjangoCATestCase):
         self.load_usable_cas()
 
 
+class DjangoCAWithClassDataTestCase(DjangoCATestCase):
+    """TestCase that loads CAs and certificates only once per class.
+
+    ``fixture_cas`` and ``fixture_certs`` name the CAs and certificates to load in ``setUpTestData()`` (by
+    default, all usable CAs and no certificates). Instances are shared by all tests in the class, so they are
+    refreshed from the database before every test and are then available in ``self.cas`` and ``self.certs``.
+    """
+
+    fixture_cas = None
+    fixture_certs = ()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        names = cls.fixture_cas
+        if names is None:
+            names = [k for k, v in certs.items() if v.get('type') == 'ca' and v['key_filename'] is not False]
+
+        cls.class_cas = {n: cls.load_ca(name=certs[n]['name'], parsed=certs[n]['pub']['parsed'])
+                         for n in names}
+        if 'child' in cls.class_cas and 'root' in cls.class_cas:
+            cls.class_cas['child'].parent = cls.class_cas['root']
+            cls.class_cas['child'].save()
+
+        cls.class_certs = {}
+        for name in cls.fixture_certs:
+            data = certs[name]
+            csr = data.get('csr', {}).get('pem', '')
+            cls.class_certs[name] = cls.load_cert(cls.class_cas[data['ca']], parsed=data['pub']['parsed'],
+                                                  csr=csr)
+
+    def setUp(self):
+        super().setUp()
+
+        # Discard any changes made by a previous test. The private key is loaded from a different temporary
+        # CA_DIR in every test (see override_tmpcadir), so the cached key is discarded as well.
+        for ca in self.class_cas.values():
+            ca.refresh_from_db()
+            ca._key = None  # pylint: disable=protected-access
+        for cert in self.class_certs.values():
+            cert.refresh_from_db()
+
+        self.cas.update(self.class_cas)
+        self.certs.update(self.class_certs)
+        self.usable_cas = {k: v for k, v in self.cas.items() if certs[k]['key_filename'] is not False}
+
+
 class DjangoCAWithGeneratedCertsTestCase(DjangoCAWithCATestCase):
     """TestCase that has all **generated** certificates preloaded."""
 
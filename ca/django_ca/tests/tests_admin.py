@@ -147,6 +147,10 @@ class CertificateAdminViewTestCase(CertificateAdminTestCaseMixin, StandardAdminV
     def test_unsupported_extensions(self):
         """Test viewing a certificate with unsupported extensions."""
         cert = self.certs['all-extensions']
+        # Extension names are memoized by OID, so discard names cached before/during this test
+        extensions._name_for_oid.cache_clear()  # pylint: disable=protected-access
+        self.addCleanup(extensions._name_for_oid.cache_clear)  # pylint: disable=protected-access
+
         # Act as if no extensions is recognized, to see what happens if we'd encounter an unknown extension.
         with mock.patch.object(models, 'OID_TO_EXTENSION', {}), \
                 mock.patch.object(extensions, 'OID_TO_EXTENSION', {}), \
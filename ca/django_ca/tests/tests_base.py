@@ -33,12 +33,16 @@ from ..extensions import PolicyConstraints
 from ..extensions import PrecertPoison
 from ..extensions import SubjectAlternativeName
 from ..extensions import TLSFeature
+from .base import TMPCADIR_BASE
 from .base import DjangoCATestCase
 from .base import DjangoCAWithCATestCase
 from .base import certs
 from .base import override_settings
 from .base import override_tmpcadir
 
+# Directory that override_tmpcadir() creates temporary CA directories in
+TMP_BASE = TMPCADIR_BASE or tempfile.gettempdir()
+
 
 class TestDjangoCATestCase(DjangoCATestCase):
     """Test some basic stuff in the base test classes."""
@@ -47,7 +51,7 @@ class TestDjangoCATestCase(DjangoCATestCase):
     def test_override_tmpcadir(self):
         """Test override_tmpcadir as decorator."""
         ca_dir = ca_settings.CA_DIR
-        self.assertTrue(ca_dir.startswith(tempfile.gettempdir()))
+        self.assertTrue(ca_dir.startswith(TMP_BASE))
 
     def test_tmpcadir(self):
         """Test the tmpcadir ad context manager."""
@@ -56,7 +60,7 @@ class TestDjangoCATestCase(DjangoCATestCase):
         with self.tmpcadir():
             ca_dir = ca_settings.CA_DIR
             self.assertNotEqual(ca_dir, old_ca_dir)
-            self.assertTrue(ca_dir.startswith(tempfile.gettempdir()))
+            self.assertTrue(ca_dir.startswith(TMP_BASE))
 
         self.assertEqual(ca_settings.CA_DIR, old_ca_dir)  # ensure that they're equal again
 
@@ -170,19 +174,19 @@ class OverrideCaDirForFuncTestCase(DjangoCATestCase):
     @override_tmpcadir()
     def test_a(self):
         # add three tests to make sure that every test case sees a different dir
-        self.assertTrue(ca_settings.CA_DIR.startswith(tempfile.gettempdir()), ca_settings.CA_DIR)
+        self.assertTrue(ca_settings.CA_DIR.startswith(TMP_BASE), ca_settings.CA_DIR)
         self.assertNotIn(ca_settings.CA_DIR, self.seen_dirs)
         self.seen_dirs.add(ca_settings.CA_DIR)
 
     @override_tmpcadir()
     def test_b(self):
-        self.assertTrue(ca_settings.CA_DIR.startswith(tempfile.gettempdir()), ca_settings.CA_DIR)
+        self.assertTrue(ca_settings.CA_DIR.startswith(TMP_BASE), ca_settings.CA_DIR)
         self.assertNotIn(ca_settings.CA_DIR, self.seen_dirs)
         self.seen_dirs.add(ca_settings.CA_DIR)
 
     @override_tmpcadir()
     def test_c(self):
-        self.assertTrue(ca_settings.CA_DIR.startswith(tempfile.gettempdir()), ca_settings.CA_DIR)
+        self.assertTrue(ca_settings.CA_DIR.startswith(TMP_BASE), ca_settings.CA_DIR)
         self.assertNotIn(ca_settings.CA_DIR, self.seen_dirs)
         self.seen_dirs.add(ca_settings.CA_DIR)
 
@@ -17,12 +17,16 @@ from ..constants import ReasonFlags
 from ..models import Certificate
 from ..signals import post_revoke_cert
 from ..signals import pre_revoke_cert
-from .base import DjangoCAWithGeneratedCertsTestCase
+from .base import DjangoCAWithClassDataTestCase
 
 
-class RevokeCertTestCase(DjangoCAWithGeneratedCertsTestCase):
+class RevokeCertTestCase(DjangoCAWithClassDataTestCase):
     """Main test class for this command."""
 
+    # Only the certificate to revoke (and its CA) is required
+    fixture_cas = ('root', )
+    fixture_certs = ('root-cert', )
+
     def setUp(self):
         super().setUp()
         self.cert = self.certs['root-cert']
@@ -37,7 +41,8 @@ class RevokeCertTestCase(DjangoCAWithGeneratedCertsTestCase):
         self.assertEqual(stdout, '')
         self.assertEqual(stderr, '')
 
-        cert = Certificate.objects.get(serial=self.cert.serial)
+        self.cert.refresh_from_db()
+        cert = self.cert
         self.assertPostRevoke(post, cert)
         self.assertTrue(cert.revoked)
         self.assertTrue(cert.revoked_date is not None)
@@ -46,25 +51,32 @@ class RevokeCertTestCase(DjangoCAWithGeneratedCertsTestCase):
     def test_with_reason(self):
         """Test revoking with a reason."""
         self.assertFalse(self.cert.revoked)
+        serial = self.cert.serial
 
-        for reason in ReasonFlags:
-            with self.assertSignal(pre_revoke_cert) as pre, self.assertSignal(post_revoke_cert) as post:
-                stdout, stderr = self.cmd_e2e(['revoke_cert', self.cert.serial, '--reason', reason.name])
-            self.assertEqual(pre.call_count, 1)
-            self.assertEqual(stdout, '')
-            self.assertEqual(stderr, '')
-
-            cert = Certificate.objects.get(serial=self.cert.serial)
-            self.assertPostRevoke(post, cert)
-            self.assertTrue(cert.revoked)
-            self.assertTrue(cert.revoked_date is not None)
-            self.assertEqual(cert.revoked_reason, reason.name)
-
-            # unrevoke for next iteration of loop
-            cert.revoked = False
-            cert.revoked_date = None
-            cert.revoked_reason = ''
-            cert.save()
+        with self.assertSignal(pre_revoke_cert) as pre, self.assertSignal(post_revoke_cert) as post:
+            for i, reason in enumerate(ReasonFlags):
+                with self.subTest(reason=reason.name):
+                    # Reset state first, so that a failure for one reason does not affect the next ones
+                    Certificate.objects.filter(pk=self.cert.pk).update(
+                        revoked=False, revoked_date=None, revoked_reason='')
+                    pre.reset_mock()
+                    post.reset_mock()
+
+                    if i == 0:
+                        # Test command line parsing for one reason only (ReasonAction is tested separately)
+                        stdout, stderr = self.cmd_e2e(['revoke_cert', serial, '--reason', reason.name])
+                    else:
+                        stdout, stderr = self.cmd('revoke_cert', serial, reason=reason)
+                    self.assertEqual(pre.call_count, 1)
+                    self.assertEqual(stdout, '')
+                    self.assertEqual(stderr, '')
+
+                    self.cert.refresh_from_db()
+                    cert = self.cert
+                    self.assertPostRevoke(post, cert)
+                    self.assertTrue(cert.revoked)
+                    self.assertTrue(cert.revoked_date is not None)
+                    self.assertEqual(cert.revoked_reason, reason.name)
 
     def test_revoked(self):
         """Test revoking a cert that is already revoked."""
@@ -74,7 +86,8 @@ class RevokeCertTestCase(DjangoCAWithGeneratedCertsTestCase):
         with self.assertSignal(pre_revoke_cert) as pre, self.assertSignal(post_revoke_cert) as post:
             self.cmd('revoke_cert', self.cert.serial)
 
-        cert = Certificate.objects.get(serial=self.cert.serial)
+        self.cert.refresh_from_db()
+        cert = self.cert
         self.assertEqual(pre.call_count, 1)
         self.assertPostRevoke(post, cert)
         self.assertEqual(cert.revoked_reason, ReasonFlags.unspecified.name)
@@ -85,7 +98,8 @@ class RevokeCertTestCase(DjangoCAWithGeneratedCertsTestCase):
         self.assertFalse(pre.called)
         self.assertFalse(post.called)
 
-        cert = Certificate.objects.get(serial=self.cert.serial)
+        self.cert.refresh_from_db()
+        cert = self.cert
         self.assertTrue(cert.revoked)
         self.assertTrue(cert.revoked_date is not None)
         self.assertEqual(cert.revoked_reason, ReasonFlags.unspecified.name)
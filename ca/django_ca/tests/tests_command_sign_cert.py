@@ -34,21 +34,25 @@ from ..extensions import KeyUsage
 from ..extensions import SubjectAlternativeName
 from ..extensions import TLSFeature
 from ..models import Certificate
-from ..models import CertificateAuthority
 from ..signals import post_issue_cert
 from ..signals import pre_issue_cert
 from ..subject import Subject
 from ..utils import ca_storage
-from .base import DjangoCAWithGeneratedCAsTestCase
+from .base import DjangoCAWithClassDataTestCase
 from .base import certs
 from .base import override_settings
 from .base import override_tmpcadir
 from .base import timestamps
 
+# Extensions expected in certificates signed with the default profile
+DEFAULT_KEY_USAGE = KeyUsage({'critical': True,
+                              'value': ['digitalSignature', 'keyAgreement', 'keyEncipherment']})
+DEFAULT_EXTENDED_KEY_USAGE = ExtendedKeyUsage({'value': ['serverAuth']})
+
 
 @override_settings(CA_MIN_KEY_SIZE=1024, CA_PROFILES={}, CA_DEFAULT_SUBJECT={})
 @freeze_time(timestamps['everything_valid'])
-class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
+class SignCertTestCase(DjangoCAWithClassDataTestCase):
     """Main test class for this command."""
 
     def setUp(self):
@@ -72,9 +76,8 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
         self.assertSubject(cert.x509, subject)
         self.assertEqual(stdout, 'Please paste the CSR:\n%s' % cert.pub)
 
-        self.assertEqual(cert.key_usage, KeyUsage({
-            'critical': True, 'value': ['digitalSignature', 'keyAgreement', 'keyEncipherment']}))
-        self.assertEqual(cert.extended_key_usage, ExtendedKeyUsage({'value': ['serverAuth']}))
+        self.assertEqual(cert.key_usage, DEFAULT_KEY_USAGE)
+        self.assertEqual(cert.extended_key_usage, DEFAULT_EXTENDED_KEY_USAGE)
         self.assertEqual(cert.subject_alternative_name,
                          SubjectAlternativeName({'value': ['DNS:example.com']}))
         self.assertIssuer(self.ca, cert)
@@ -85,31 +88,30 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
         """Test signing with all usable CAs."""
 
         for name, ca in self.usable_cas.items():
-            cname = '%s-signed.example.com' % name
-            stdin = StringIO(self.csr_pem)
-            subject = Subject([('CN', cname)])
-
-            with self.assertSignal(pre_issue_cert) as pre, self.assertSignal(post_issue_cert) as post:
-                stdout, stderr = self.cmd('sign_cert', ca=ca, subject=subject,
-                                          password=certs[name]['password'], stdin=stdin)
-
-            self.assertEqual(stderr, '')
-            self.assertEqual(pre.call_count, 1)
-
-            cert = Certificate.objects.get(ca=ca, cn=cname)
-            self.assertPostIssueCert(post, cert)
-            self.assertSignature(reversed(ca.bundle), cert)
-            self.assertSubject(cert.x509, subject)
-            self.assertEqual(stdout, 'Please paste the CSR:\n%s' % cert.pub)
-
-            self.assertEqual(cert.key_usage,
-                             KeyUsage({'critical': True,
-                                       'value': ['digitalSignature', 'keyAgreement', 'keyEncipherment']}))
-            self.assertEqual(cert.extended_key_usage, ExtendedKeyUsage({'value': ['serverAuth']}))
-            self.assertEqual(cert.subject_alternative_name,
-                             SubjectAlternativeName({'value': ['DNS:%s' % cname]}))
-            self.assertIssuer(ca, cert)
-            self.assertAuthorityKeyIdentifier(ca, cert)
+            with self.subTest(ca=name):
+                cname = '%s-signed.example.com' % name
+                stdin = StringIO(self.csr_pem)
+                subject = Subject([('CN', cname)])
+
+                with self.assertSignal(pre_issue_cert) as pre, self.assertSignal(post_issue_cert) as post:
+                    stdout, stderr = self.cmd('sign_cert', ca=ca, subject=subject,
+                                              password=certs[name]['password'], stdin=stdin)
+
+                self.assertEqual(stderr, '')
+                self.assertEqual(pre.call_count, 1)
+
+                cert = Certificate.objects.get(ca=ca, cn=cname)
+                self.assertPostIssueCert(post, cert)
+                self.assertSignature(reversed(ca.bundle), cert)
+                self.assertSubject(cert.x509, subject)
+                self.assertEqual(stdout, 'Please paste the CSR:\n%s' % cert.pub)
+
+                self.assertEqual(cert.key_usage, DEFAULT_KEY_USAGE)
+                self.assertEqual(cert.extended_key_usage, DEFAULT_EXTENDED_KEY_USAGE)
+                self.assertEqual(cert.subject_alternative_name,
+                                 SubjectAlternativeName({'value': ['DNS:%s' % cname]}))
+                self.assertIssuer(ca, cert)
+                self.assertAuthorityKeyIdentifier(ca, cert)
 
     @override_tmpcadir()
     def test_from_file(self):
@@ -131,10 +133,8 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
 
             self.assertSubject(cert.x509, subject)
             self.assertEqual(stdout, cert.pub)
-            self.assertEqual(cert.key_usage,
-                             KeyUsage({'critical': True,
-                                       'value': ['digitalSignature', 'keyAgreement', 'keyEncipherment']}))
-            self.assertEqual(cert.extended_key_usage, ExtendedKeyUsage({'value': ['serverAuth']}))
+            self.assertEqual(cert.key_usage, DEFAULT_KEY_USAGE)
+            self.assertEqual(cert.extended_key_usage, DEFAULT_EXTENDED_KEY_USAGE)
             self.assertEqual(cert.subject_alternative_name,
                              SubjectAlternativeName({'value': ['DNS:example.com']}))
         finally:
@@ -337,7 +337,8 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
         ca = self.cas['pwd']
         self.assertIsNotNone(ca.key(password=password))
 
-        ca = CertificateAuthority.objects.get(pk=ca.pk)
+        # Discard the private key cached by the call above, so that the command has to load it again
+        ca._key = None  # pylint: disable=protected-access
 
         # Giving no password raises a CommandError
         stdin = StringIO(self.csr_pem)
@@ -349,7 +350,7 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
 
         # Pass a password
         stdin = StringIO(self.csr_pem)
-        ca = CertificateAuthority.objects.get(pk=ca.pk)
+        ca._key = None  # pylint: disable=protected-access
         with self.assertSignal(pre_issue_cert) as pre, self.assertSignal(post_issue_cert) as post:
             self.cmd('sign_cert', ca=ca, alt=SubjectAlternativeName({'value': ['example.com']}),
                      stdin=stdin, password=password)
@@ -358,7 +359,7 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
 
         # Pass the wrong password
         stdin = StringIO(self.csr_pem)
-        ca = CertificateAuthority.objects.get(pk=ca.pk)
+        ca._key = None  # pylint: disable=protected-access
         with self.assertCommandError(self.re_false_password), \
                 self.assertSignal(pre_issue_cert) as pre, self.assertSignal(post_issue_cert) as post:
             self.cmd('sign_cert', ca=ca, alt=SubjectAlternativeName({'value': ['example.com']}),
@@ -413,10 +414,8 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
 
             self.assertSubject(cert.x509, subject)
             self.assertEqual(stdout, cert.pub)
-            self.assertEqual(cert.key_usage,
-                             KeyUsage({'critical': True,
-                                       'value': ['digitalSignature', 'keyAgreement', 'keyEncipherment']}))
-            self.assertEqual(cert.extended_key_usage, ExtendedKeyUsage({'value': ['serverAuth']}))
+            self.assertEqual(cert.key_usage, DEFAULT_KEY_USAGE)
+            self.assertEqual(cert.extended_key_usage, DEFAULT_EXTENDED_KEY_USAGE)
             self.assertEqual(cert.subject_alternative_name,
                              SubjectAlternativeName({'value': ['DNS:example.com']}))
         finally:
@@ -459,7 +458,6 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
         self.assertFalse(post.called)
 
     @override_tmpcadir()
-    @freeze_time(timestamps['everything_valid'])
     def test_revoked_ca(self):
         """Test signing with a revoked CA."""
         self.ca.revoke()
@@ -474,7 +472,6 @@ class SignCertTestCase(DjangoCAWithGeneratedCAsTestCase):
         self.assertFalse(post.called)
 
     @override_tmpcadir()
-    @freeze_time(timestamps['everything_valid'])
     def test_unusable_ca(self):
         """Test signing with an unusable CA."""
         path = ca_storage.path(self.ca.private_key_path)
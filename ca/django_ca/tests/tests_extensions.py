@@ -51,6 +51,7 @@ from ..extensions import PrecertPoison
 from ..extensions import SubjectAlternativeName
 from ..extensions import SubjectKeyIdentifier
 from ..extensions import TLSFeature
+from ..extensions import __all__ as extensions_all
 from ..extensions.base import ListExtension
 from ..extensions.base import OrderedSetExtension
 from ..extensions.base import UnrecognizedExtension
@@ -1037,6 +1038,11 @@ class ExtensionTestCase(AbstractExtensionTestMixin, TestCase):
         },
     }
 
+    def test_all(self):
+        """Test that ``__all__`` exports exactly the extension classes (and get_extension_name())."""
+        self.assertEqual(set(extensions_all),
+                         {'get_extension_name'} | {cls.__name__ for cls in KEY_TO_EXTENSION.values()})
+
     def test_from_extension(self):
         """Test constructor from cryptography extension - not implemented in base class."""
         ext = x509.Extension(oid=x509.ExtensionOID.BASIC_CONSTRAINTS, critical=True,
@@ -55,6 +55,45 @@ class DistributionPointTestCase(TestCase):
         self.assertEqual(dpoint.crl_issuer, [uri('http://example.net')])
         self.assertIsNone(dpoint.reasons)
 
+    def test_from_cryptography(self):
+        """Test the from_cryptography() constructor."""
+        crypto = x509.DistributionPoint(full_name=[uri('http://example.com')], relative_name=None,
+                                        crl_issuer=[uri('http://example.net')],
+                                        reasons=frozenset([x509.ReasonFlags.key_compromise]))
+        dpoint = DistributionPoint.from_cryptography(crypto)
+        self.assertEqual(dpoint, DistributionPoint(crypto))
+        self.assertEqual(dpoint.full_name, [uri('http://example.com')])
+        self.assertIsNone(dpoint.relative_name)
+        self.assertEqual(dpoint.crl_issuer, [uri('http://example.net')])
+        self.assertEqual(dpoint.reasons, frozenset([x509.ReasonFlags.key_compromise]))
+        self.assertEqual(dpoint.for_extension_type, crypto)
+
+    def test_from_dict(self):
+        """Test the from_dict() constructor."""
+        data = {'full_name': 'http://example.com', 'reasons': ['key_compromise']}
+        dpoint = DistributionPoint.from_dict(data)
+        self.assertEqual(dpoint, DistributionPoint(data))
+        self.assertEqual(dpoint.full_name, [uri('http://example.com')])
+        self.assertIsNone(dpoint.relative_name)
+        self.assertIsNone(dpoint.crl_issuer)
+        self.assertEqual(dpoint.reasons, frozenset([x509.ReasonFlags.key_compromise]))
+
+        with self.assertRaisesRegex(ValueError, r'^full_name and relative_name cannot both have a value$'):
+            DistributionPoint.from_dict({
+                'full_name': ['http://example.com'],
+                'relative_name': '/CN=example.com',
+            })
+
+    def test_eq(self):
+        """Test comparison."""
+        dpoint = DistributionPoint({'full_name': 'http://example.com', 'reasons': ['key_compromise']})
+        self.assertEqual(dpoint, dpoint)
+        self.assertEqual(dpoint, DistributionPoint({'full_name': 'http://example.com',
+                                                    'reasons': ['key_compromise']}))
+        self.assertNotEqual(dpoint, DistributionPoint({'full_name': 'http://example.com'}))
+        self.assertNotEqual(dpoint, DistributionPoint())
+        self.assertNotEqual(dpoint, 'http://example.com')
+
     def test_init_errors(self):
         """Test various invalid input values."""
         with self.assertRaisesRegex(ValueError, r'^data must be x509.DistributionPoint or dict$'):
@@ -75,6 +114,8 @@ class DistributionPointTestCase(TestCase):
 class PolicyInformationTestCase(DjangoCATestCase):
     """Test PolicyInformation class."""
 
+    # pylint: disable=too-many-public-methods; PolicyInformation implements the full mutable sequence API
+
     oid = '2.5.29.32.0'
 
     # various qualifiers
@@ -246,6 +287,15 @@ class PolicyInformationTestCase(DjangoCATestCase):
         })
         self.assertEqual(len(pinfo), 1)
 
+        # organization is converted to str if it is not already a str
+        pinfo = PolicyInformation({
+            'policy_identifier': self.oid,
+            'policy_qualifiers': [{
+                'notice_reference': {'organization': b'text3', 'notice_numbers': [1]},
+            }],
+        })
+        self.assertEqual(pinfo, self.pi3)
+
     def test_constructor_errors(self):
         """Test various invalid values for the constructor."""
         with self.assertRaisesRegex(
@@ -302,6 +352,15 @@ class PolicyInformationTestCase(DjangoCATestCase):
         with self.assertRaisesRegex(IndexError, r'^list assignment index out of range$'):
             del self.pi1[0]
 
+    def test_eq(self):
+        """Test comparison."""
+        self.assertEqual(self.pi1, self.pi1)
+        self.assertEqual(self.pi1, PolicyInformation(self.s1))
+        self.assertEqual(self.pi_empty, PolicyInformation())
+        self.assertNotEqual(self.pi1, self.pi2)
+        self.assertNotEqual(self.pi1, self.pi_empty)
+        self.assertNotEqual(self.pi1, self.s1)
+
     def test_extend(self):
         """Test PolicyInformation.extend()."""
         self.pi1.extend([self.q2, self.q4])
@@ -64,6 +64,21 @@ class DirectoryTestCase(DjangoCAWithCATestCase):
     """Test basic ACMEv2 directory view."""
     url = reverse('django_ca:acme-directory')
 
+    def get_expected_directory(self, response, ca, **kwargs):
+        """Get the directory expected for `ca` in the given response (with a mocked random entry)."""
+        req = response.wsgi_request
+        base = f'/django_ca/acme/{ca.serial}'
+        expected = {
+            'Zm9vYmFy': 'https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417',
+            'keyChange': 'http://localhost:8000/django_ca/acme/todo/key-change',
+            'revokeCert': 'http://localhost:8000/django_ca/acme/todo/revoke-cert',
+            'newAccount': req.build_absolute_uri(f'{base}/new-account/'),
+            'newNonce': req.build_absolute_uri(f'{base}/new-nonce/'),
+            'newOrder': req.build_absolute_uri(f'{base}/new-order/'),
+        }
+        expected.update(kwargs)
+        return expected
+
     @freeze_time(timestamps['everything_valid'])
     def test_default(self):
         """Test the default directory view."""
@@ -74,15 +89,7 @@ class DirectoryTestCase(DjangoCAWithCATestCase):
         with mock.patch('secrets.token_bytes', return_value=b'foobar'):
             response = self.client.get(self.url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        req = response.wsgi_request
-        self.assertEqual(response.json(), {
-            'Zm9vYmFy': 'https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417',
-            'keyChange': 'http://localhost:8000/django_ca/acme/todo/key-change',
-            'revokeCert': 'http://localhost:8000/django_ca/acme/todo/revoke-cert',
-            'newAccount': req.build_absolute_uri('/django_ca/acme/%s/new-account/' % ca.serial),
-            'newNonce': req.build_absolute_uri('/django_ca/acme/%s/new-nonce/' % ca.serial),
-            'newOrder': req.build_absolute_uri('/django_ca/acme/%s/new-order/' % ca.serial),
-        })
+        self.assertEqual(response.json(), self.get_expected_directory(response, ca))
 
     @freeze_time(timestamps['everything_valid'])
     def test_named_ca(self):
@@ -97,15 +104,7 @@ class DirectoryTestCase(DjangoCAWithCATestCase):
             response = self.client.get(url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response['Content-Type'], 'application/json')
-        req = response.wsgi_request
-        self.assertEqual(response.json(), {
-            'Zm9vYmFy': 'https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417',
-            'keyChange': 'http://localhost:8000/django_ca/acme/todo/key-change',
-            'revokeCert': 'http://localhost:8000/django_ca/acme/todo/revoke-cert',
-            'newAccount': req.build_absolute_uri('/django_ca/acme/%s/new-account/' % ca.serial),
-            'newNonce': req.build_absolute_uri('/django_ca/acme/%s/new-nonce/' % ca.serial),
-            'newOrder': req.build_absolute_uri('/django_ca/acme/%s/new-order/' % ca.serial),
-        })
+        self.assertEqual(response.json(), self.get_expected_directory(response, ca))
 
     @freeze_time(timestamps['everything_valid'])
     def test_meta(self):
@@ -122,22 +121,13 @@ class DirectoryTestCase(DjangoCAWithCATestCase):
             response = self.client.get(url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response['Content-Type'], 'application/json')
-        req = response.wsgi_request
-        self.assertEqual(response.json(), {
-            'Zm9vYmFy': 'https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417',
-            'keyChange': 'http://localhost:8000/django_ca/acme/todo/key-change',
-            'revokeCert': 'http://localhost:8000/django_ca/acme/todo/revoke-cert',
-            'newAccount': req.build_absolute_uri('/django_ca/acme/%s/new-account/' % ca.serial),
-            'newNonce': req.build_absolute_uri('/django_ca/acme/%s/new-nonce/' % ca.serial),
-            'newOrder': req.build_absolute_uri('/django_ca/acme/%s/new-order/' % ca.serial),
-            'meta': {
-                'termsOfService': ca.terms_of_service,
-                'caaIdentities': [
-                    ca.caa_identity,
-                ],
-                'website': ca.website,
-            },
-        })
+        self.assertEqual(response.json(), self.get_expected_directory(response, ca, meta={
+            'termsOfService': ca.terms_of_service,
+            'caaIdentities': [
+                ca.caa_identity,
+            ],
+            'website': ca.website,
+        }))
 
     @freeze_time(timestamps['everything_valid'])
     def test_acme_default_disabled(self):
@@ -289,7 +279,7 @@ KSAr5SU7IyM/9M95oQIDAQAB
             The decoded bytes of the nonce.
         """
         if ca is None:
-            ca = self.cas['root']
+            ca = self.ca
 
         url = reverse('django_ca:acme-new-nonce', kwargs={'serial': ca.serial})
         response = self.client.head(url)
@@ -313,9 +303,7 @@ KSAr5SU7IyM/9M95oQIDAQAB
 class AcmeNewNonceViewTestCase(DjangoCAWithCATestCase):
     """Test getting a new ACME nonce."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse('django_ca:acme-new-nonce', kwargs={'serial': self.cas['root'].serial})
+    url = reverse('django_ca:acme-new-nonce', kwargs={'serial': certs['root']['serial']})
 
     @override_settings(CA_ENABLE_ACME=False)
     def test_disabled(self):
@@ -327,15 +315,14 @@ class AcmeNewNonceViewTestCase(DjangoCAWithCATestCase):
     def test_get_nonce(self):
         """Test that getting multiple nonces returns unique nonces."""
 
-        nonces = []
+        nonces = set()
         for _i in range(1, 5):
             response = self.client.head(self.url)
             self.assertEqual(response.status_code, HTTPStatus.OK)
             self.assertEqual(len(response['replay-nonce']), 43)
             self.assertEqual(response['cache-control'], 'no-store')
-            nonces.append(response['replay-nonce'])
-
-        self.assertEqual(len(nonces), len(set(nonces)))
+            self.assertNotIn(response['replay-nonce'], nonces)
+            nonces.add(response['replay-nonce'])
 
     def test_get_request(self):
         """RFC 8555, section 7.2 also specifies a GET request."""
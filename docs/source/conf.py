@@ -18,7 +18,6 @@ import re
 import sys
 
 import sphinx_autodoc_typehints
-import sphinx_rtd_theme
 from docutils.nodes import Text as DocutilsText
 from docutils.nodes import literal
 from pygments.lexer import do_insertions
@@ -35,7 +34,7 @@ from sphinx.highlighting import lexers
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #sys.path.insert(0, os.path.abspath('.'))
 
-_BASE_DIR = os.path.dirname(os.path.abspath(__name__))
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 _ROOT_DIR = os.path.dirname(os.path.dirname(_BASE_DIR))
 _SRC_DIR = os.path.join(_ROOT_DIR, 'ca')
 _FIXTURES = os.path.join(_SRC_DIR, 'django_ca', 'tests', 'fixtures')
@@ -108,7 +107,7 @@ import django_ca  # NOQA
 # built documents.
 
 # The short X.Y version.
-version = '.'.join([str(e) for e in django_ca.VERSION[:2]])
+version = '%d.%d' % django_ca.VERSION[:2]
 # The full version, including alpha/beta/rc tags.
 release = django_ca.__version__
 
@@ -161,7 +160,7 @@ todo_include_todos = False
 
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
-html_theme = 'alabaster'
+html_theme = 'sphinx_rtd_theme'
 
 # Theme options are theme-specific and customize the look and feel of a theme
 # further.  For a list of options available for each theme, see the
@@ -353,13 +352,8 @@ intersphinx_mapping = {
     'acme': ('https://acme-python.readthedocs.io/en/stable/', None),
 }
 
-html_theme = "sphinx_rtd_theme"
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
 
 # Custom console lexer to make space part of the prompt
-line_re = re.compile('.*?\n')
-
-
 class BashSessionLexer(ShellSessionBaseLexer):
     """
     Lexer for Bash shell sessions, i.e. command lines, including a
@@ -378,19 +372,30 @@ class BashSessionLexer(ShellSessionBaseLexer):
         r'^((?:(?:\[.*?\])|(?:\(\S+\))?(?:| |sh\S*?|\w+\S+[@:]\S+(?:\s+\S+)' \
         r'?|\[\S+[@:][^\n]+\].+))\s*[$#%]\s*)(.*\n?)')
     _ps2 = '> '
+    _ps2_len = len(_ps2)
 
     _venv = re.compile(r'^(\([^)]*\))(\s*)')
 
+    def __init__(self, **options):
+        super().__init__(**options)
+
+        # The inner lexer keeps no state between calls, so it can be shared by all code blocks
+        self._innerlexer = self._innerLexerCls(**self.options)
+
     def get_tokens_unprocessed(self, text):
-        innerlexer = self._innerLexerCls(**self.options)
+        innerlexer = self._innerlexer
 
         pos = 0
         curcode = ''
         insertions = []
         backslash_continuation = False
 
-        for match in line_re.finditer(text):
-            line = match.group()
+        # Iterate over all lines ending with a newline (like matching ".*?\n") and track their offsets
+        offset = 0
+        for line in text.split('\n')[:-1]:
+            line += '\n'
+            line_start, offset = offset, offset + len(line)
+
             if backslash_continuation and not line.startswith(self._ps2):
                 curcode += line
                 backslash_continuation = curcode.endswith('\\\n')
@@ -407,13 +412,18 @@ class BashSessionLexer(ShellSessionBaseLexer):
                         [(0, Text, venv_whitespace)]))
                 line = line[venv_match.end():]
 
-            m = self._ps1rgx.match(line)
+            # Every prompt ends with one of these characters, so most output lines can skip the regex
+            if '$' in line or '#' in line or '%' in line:
+                m = self._ps1rgx.match(line)
+            else:
+                m = None
+
             if m:
                 # To support output lexers (say diff output), the output
                 # needs to be broken by prompts whenever the output lexer
                 # changes.
                 if not insertions:
-                    pos = match.start()
+                    pos = line_start
 
                 insertions.append((len(curcode),
                                    [(0, Generic.Prompt, m.group(1))]))
@@ -421,15 +431,15 @@ class BashSessionLexer(ShellSessionBaseLexer):
                 backslash_continuation = curcode.endswith('\\\n')
             elif line.startswith(self._ps2):
                 insertions.append((len(curcode),
-                                   [(0, Generic.Prompt, line[:len(self._ps2)])]))
-                curcode += line[len(self._ps2):]
+                                   [(0, Generic.Prompt, line[:self._ps2_len])]))
+                curcode += line[self._ps2_len:]
                 backslash_continuation = curcode.endswith('\\\n')
             else:
                 if insertions:
                     toks = innerlexer.get_tokens_unprocessed(curcode)
                     for i, t, v in do_insertions(insertions, toks):
                         yield pos+i, t, v
-                yield match.start(), Generic.Output, line
+                yield line_start, Generic.Output, line
                 insertions = []
                 curcode = ''
         if insertions:
@@ -467,17 +477,18 @@ text_overrides = {
     'ExtensionTypeVar': 'ExtensionType',
 }
 
+# Roles rendered by format_annotation() for overridden classes
+qualname_override_roles = {k: f':py:class:`~{v}`' for k, v in qualname_overrides.items()}
+
 fa_orig = sphinx_autodoc_typehints.format_annotation
 
 
 def format_annotation(annotation, fully_qualified: bool = False):
     if inspect.isclass(annotation):
         full_name = f'{annotation.__module__}.{annotation.__qualname__}'
-        if 'ident' in full_name.lower():
-            print(full_name)
-        override = qualname_overrides.get(full_name)
-        if override is not None:
-            return f':py:class:`~{override}`'
+        role = qualname_override_roles.get(full_name)
+        if role is not None:
+            return role
     return fa_orig(annotation, fully_qualified=fully_qualified)
 
 
@@ -492,23 +503,32 @@ def resolve_internal_aliases(app, doctree):
         * https://stackoverflow.com/a/62301461
 
     """
-    pending_xrefs = doctree.traverse(condition=pending_xref)
-    for node in pending_xrefs:
+    for node in doctree.traverse(pending_xref):
         alias = node.get('reftarget', None)
+        if alias is None:
+            continue
 
-        if alias is not None and alias in qualname_overrides:
-            node['reftarget'] = qualname_overrides[alias]
+        override = qualname_overrides.get(alias)
+        if override is not None:
+            node['reftarget'] = override
 
             # In TypeVar cases, this is plain text and not a type, so we wrap it ina literal for common look
             if not isinstance(node.children[0], literal):
                 node.children = [literal('', '', *node.children, classes=['xref', 'py', 'py-class'])]
 
-        if alias is not None and alias in text_overrides:
+        text_override = text_overrides.get(alias)
+        if text_override is not None:
             # this will rewrite the rendered text:
             # find the text node child
-            text_node = next(iter(node.traverse(lambda n: n.tagname == '#text')))
-            text_node.parent.replace(text_node, DocutilsText(text_overrides[alias], ''))
+            text_node = next(iter(node.traverse(DocutilsText)))
+            text_node.parent.replace(text_node, DocutilsText(text_override, ''))
 
 
 def setup(app):
     app.connect('doctree-read', resolve_internal_aliases)
+
+    # resolve_internal_aliases() only modifies the doctree it receives, so parallel builds (-j) are safe
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }